@@ -1,7 +1,8 @@
 # Importing necessary Python libraries
 
+import numpy as np                  # For fast whole-column math on the match scores
 import pandas as pd                  # For reading and working with spreadsheet data (CSV files)
-from fuzzywuzzy import process      # For matching similar-looking text using "fuzzy logic"
+from rapidfuzz import process, fuzz, utils  # For matching similar-looking text using "fuzzy logic" (fast C++ core)
 from tqdm import tqdm               # For showing a visual progress bar during processing
 import time                         # For tracking how long the script takes to run
 import os                           # For working with file names and extensions
@@ -27,55 +28,97 @@ person_query = pd.read_csv(comparison_file)
 # We create a new column called `address_key` for both files.
 # This column combines street address and city, and makes everything lowercase with no extra spaces.
 # This helps avoid mismatches due to capital letters, commas, or extra spaces.
+# The columns are first stored as Arrow-backed text, so the lowercase/strip steps run as
+# fast whole-column operations instead of one Python string at a time.
 
 # In the input file:
 dev_batch['address_key'] = (
-    dev_batch['person_address_1'].fillna('').str.lower().str.strip() + ', ' +
-    dev_batch['person_city'].fillna('').str.lower().str.strip()
+    dev_batch['person_address_1'].astype('string[pyarrow]').fillna('').str.lower().str.strip() + ', ' +
+    dev_batch['person_city'].astype('string[pyarrow]').fillna('').str.lower().str.strip()
 )
 
 # In the comparison file:
 person_query['address_key'] = (
-    person_query['Address 1'].fillna('').str.lower().str.strip() + ', ' +
-    person_query['City'].fillna('').str.lower().str.strip()
+    person_query['Address 1'].astype('string[pyarrow]').fillna('').str.lower().str.strip() + ', ' +
+    person_query['City'].astype('string[pyarrow]').fillna('').str.lower().str.strip()
 )
 
 # --- STEP 4: Define the fuzzy matching logic ---
 
-# This function will take one row from the input file, and try to find the best address match in the comparison file.
-def best_address_match(row, threshold=90):
-    target = row['address_key']  # Get the cleaned address from the input row
+# This function compares every input address against every comparison address.
+# RapidFuzz builds a grid of similarity scores (rows = input, columns = comparison)
+# in compiled code, using all CPU cores, instead of checking one row at a time in Python.
+# The input rows are handled in chunks so the grid never has to hold every row at once.
+def best_address_matches(queries, choices, choice_ids, threshold=90, chunk_size=4096):
+    # Start with every row marked as unmatched: empty Person ID and "YES" (new person)
+    person_ids = np.full(len(queries), '', dtype=object)
+    new_person_flags = np.full(len(queries), 'YES', dtype=object)
 
-    # Use fuzzy logic to find the closest match in the comparison address list
-    result = process.extractOne(target, person_query['address_key'])
+    # Nothing to compare against, so nothing can match
+    if not choices:
+        return person_ids, new_person_flags
 
-    # If the best match has a high enough similarity score, we consider it a valid match
-    if result and result[1] >= threshold:
-        # Find the row in the comparison file that matched
-        matched_row = person_query[person_query['address_key'] == result[0]]
-        # Return the Person ID from that matched row, and mark as "NO" (not new)
-        return matched_row['Person ID'].values[0], 'NO'
+    for start in tqdm(range(0, len(queries), chunk_size), desc="Matching", mininterval=0.5):
+        chunk = queries[start:start + chunk_size]
 
-    # If no good match was found, return empty and mark as "YES" (new person)
-    return '', 'YES'
+        # Score this chunk against every choice (0-100, stored compactly as small integers).
+        # Scores below the threshold are reported as 0, which lets RapidFuzz give up early on them.
+        # default_process also drops punctuation before scoring (so "123 main st." and
+        # "123 main st" count as the same), just like the original fuzzywuzzy matching did.
+        scores = process.cdist(chunk, choices, scorer=fuzz.WRatio, processor=utils.default_process,
+                               score_cutoff=threshold, workers=-1, dtype=np.uint8)
 
-# --- STEP 5: Loop through all input addresses and try to find matches ---
+        # For each input row, find the column with the highest score and what that score was
+        best_idx = scores.argmax(axis=1)
+        best_score = scores[np.arange(len(scores)), best_idx]
+
+        # If the best match has a high enough similarity score, we consider it a valid match:
+        # store the Person ID from that matched row, and mark as "NO" (not new).
+        matched = best_score >= threshold
+        rows = slice(start, start + len(chunk))
+        person_ids[rows] = np.where(matched, choice_ids[best_idx], '')
+        new_person_flags[rows] = np.where(matched, 'NO', 'YES')
+
+    return person_ids, new_person_flags
+
+# --- STEP 5: Match all input addresses at once ---
 
 # Start a stopwatch to measure how long the whole process takes
 start_time = time.time()
 
-# Create empty lists to store results
-person_ids = []         # List of matched Person IDs
-new_person_flags = []   # List of "YES"/"NO" indicating whether it's a new person
-
 # Print a message so the user knows the process has started
 print("Starting fuzzy address matching...")
 
-# Loop through each row in the input file, and show a progress bar
-for _, row in tqdm(dev_batch.iterrows(), total=len(dev_batch), desc="Matching"):
-    pid, new_flag = best_address_match(row)  # Call the function to get match results
-    person_ids.append(pid)                   # Save the matched Person ID (or blank)
-    new_person_flags.append(new_flag)        # Save the YES/NO flag
+# Rows with no address and no city (key ", ") have nothing to match on, so they stay
+# unmatched and are marked as new people, the same as before.
+def is_blank_key(keys):
+    return keys.map(lambda key: not utils.default_process(key)).to_numpy(dtype=bool)
+
+is_blank = is_blank_key(dev_batch['address_key'])
+
+# Addresses that appear word-for-word in the comparison file don't need fuzzy scoring.
+# Look them up directly (keeping the first Person ID listed for each address).
+known = person_query.loc[~is_blank_key(person_query['address_key'])]
+exact_ids = known.drop_duplicates('address_key').set_index('address_key')['Person ID']
+is_exact = dev_batch['address_key'].isin(exact_ids.index).to_numpy() & ~is_blank
+
+person_ids = np.full(len(dev_batch), '', dtype=object)
+new_person_flags = np.full(len(dev_batch), 'YES', dtype=object)
+person_ids[is_exact] = dev_batch.loc[is_exact, 'address_key'].map(exact_ids).to_numpy(dtype=object)
+new_person_flags[is_exact] = 'NO'
+
+# Only the remaining non-blank rows go through fuzzy matching.
+# The same address often shows up several times (e.g. people in one household), so each
+# distinct address is scored once and the result is copied back to every row that has it.
+residual = ~is_exact & ~is_blank
+residual_codes, residual_keys = pd.factorize(dev_batch.loc[residual, 'address_key'])
+unique_ids, unique_flags = best_address_matches(
+    list(residual_keys),
+    person_query['address_key'].tolist(),
+    person_query['Person ID'].to_numpy(dtype=object),
+)
+person_ids[residual] = unique_ids[residual_codes]
+new_person_flags[residual] = unique_flags[residual_codes]
 
 # --- STEP 6: Add the results to the original spreadsheet ---
 
@@ -98,7 +141,7 @@ dev_batch.to_csv(output_file, index=False)
 # --- STEP 8: Print out a summary of what happened ---
 
 # Count how many matches we found
-match_count = sum(flag == 'NO' for flag in new_person_flags)
+match_count = int((new_person_flags == 'NO').sum())
 no_match_count = len(dev_batch) - match_count
 elapsed = time.time() - start_time
 
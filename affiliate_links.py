@@ -1,7 +1,11 @@
+import codecs
+import mmap
+import os
 import re
 
 # Define the affiliate ID to append
 affiliate_id = "cr2tm-20"
+affiliate_tag = f"?tag={affiliate_id}".encode('utf-8')
 
 # Prompt the user for the input filename
 input_filename = input("Enter the input filename (with extension): ")
@@ -9,29 +13,68 @@ input_filename = input("Enter the input filename (with extension): ")
 # Prompt the user for the output filename
 output_filename = input("Enter the output filename (with extension): ")
 
-# Define a regex pattern to find Amazon links
-amazon_link_pattern = r"https://www\.amazon\.com/dp/[\w\d]+"
+# Define one regex pattern that finds both things we edit, so the file is scanned only once:
+# Amazon links (including any affiliate tag they already carry) and Roman numeral section headings
+edit_pattern = re.compile(
+    rb"(?P<link>https://www\.amazon\.com/dp/\w+(?:\?tag=[\w-]+)?)"
+    rb"|(?P<heading>^\s*[IVXLCDM]+\.\s*)",
+    re.MULTILINE,
+)
+
+# Untouched text is copied (and checked) in pieces of at most this many bytes
+COPY_CHUNK = 1 << 20  # 1 MiB
+
+# Copy the input to the output, tagging Amazon links and dropping Roman numeral headings.
+# The input is memory-mapped and written out piece by piece, so the whole file is never
+# held in memory as a second, edited copy.
+# Every piece copied over is also run through a UTF-8 decoder, so a file that isn't
+# UTF-8 still raises UnicodeDecodeError (the removed headings are plain ASCII).
+def rewrite(src, dst):
+    if os.fstat(src.fileno()).st_size == 0:
+        return  # an empty file cannot be memory-mapped, and there is nothing to edit
+
+    check_utf8 = codecs.getincrementaldecoder('utf-8')().decode
+
+    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as content, \
+         memoryview(content) as view:
+
+        # Copy bytes start..end-1 in COPY_CHUNK slices of the memory map, so a long
+        # stretch without links is never held in memory all at once
+        def copy(start, end):
+            for pos in range(start, end, COPY_CHUNK):
+                with view[pos:min(pos + COPY_CHUNK, end)] as piece:
+                    check_utf8(piece)
+                    dst.write(piece)
+
+        last_end = 0
+        for match in edit_pattern.finditer(content):
+            # Copy the untouched text between the previous edit and this one
+            copy(last_end, match.start())
+
+            # Keep links, appending the affiliate tag unless it already has one;
+            # headings are skipped, which removes them
+            if match.lastgroup == "link":
+                link = match.group(0)
+                dst.write(link)
+                if b"?tag=" not in link:
+                    dst.write(affiliate_tag)
+
+            last_end = match.end()
+
+        copy(last_end, len(content))
+        check_utf8(b"", final=True)
 
 try:
-    # Read the input file with UTF-8 encoding
-    with open(input_filename, 'r', encoding='utf-8') as file:
-        content = file.read()
-    
-    # Find all Amazon links in the file
-    amazon_links = re.findall(amazon_link_pattern, content)
-    
-    # Replace each Amazon link by appending the affiliate tag
-    for link in amazon_links:
-        if "?tag=" not in link:  # Avoid duplicating the affiliate tag if it already exists
-            updated_link = f"{link}?tag={affiliate_id}"
-            content = content.replace(link, updated_link)
-    
-    # Remove Roman numeral section headings
-    content = re.sub(r"^\s*[IVXLCDM]+\.\s*", "", content, flags=re.MULTILINE)
-    
-    # Write the updated content to the output file with UTF-8 encoding
-    with open(output_filename, 'w', encoding='utf-8') as file:
-        file.write(content)
+    # Write to a temporary file first, so the input can also be used as the output
+    temp_filename = f"{output_filename}.tmp"
+    try:
+        with open(input_filename, 'rb') as src, open(temp_filename, 'wb') as dst:
+            rewrite(src, dst)
+        os.replace(temp_filename, output_filename)
+    finally:
+        # Don't leave a half-written temporary file behind if anything went wrong
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
     
     print(f"File successfully processed. Updated content saved to: {output_filename}")
 
@@ -1,4 +1,3 @@
-import os
 import pandas as pd
 
 # Define paths for each CSV file
@@ -39,32 +38,28 @@ csv_paths = [
 
 # Load the '2122_Student.csv' file to use its headers as the master column set
 master_columns_path = '2122_Student.csv'
-master_df = pd.read_csv(master_columns_path)
+master_df = pd.read_csv(master_columns_path, nrows=0)  # only the header row is needed
 
 # Get the master column headers from the 2122 CSV file
 master_columns = master_df.columns
 
-# Initialize a list to store DataFrames that match the master column headers
-aligned_dataframes = []
+# Save the combined data to a single master CSV file
+final_master_csv_path = 'master_student_data_aligned.csv'
 
-# Process each CSV file: load, align columns to master, and append to list
+# Write the header row once; every file below is appended underneath it
+pd.DataFrame(columns=master_columns).to_csv(final_master_csv_path, index=False)
+
+# Process each CSV file: load, align columns to master, and append to the master file.
+# Each file is written out as soon as it is aligned, so only one file is held in memory
+# at a time instead of every file plus a combined copy. The PyArrow reader parses in
+# parallel and keeps columns in compact Arrow form rather than as Python objects.
 for path in csv_paths:
-    df = pd.read_csv(path)
-    
-    # Drop columns that are entirely empty
-    df = df.dropna(axis=1, how='all')
-    
+    df = pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow')
+
     # Reindex the DataFrame to match the master columns, filling missing columns with NaN
     aligned_df = df.reindex(columns=master_columns)
-    
-    # Append the aligned DataFrame to the list
-    aligned_dataframes.append(aligned_df)
 
-# Concatenate all aligned DataFrames along rows, aligning columns by name
-combined_df = pd.concat(aligned_dataframes, axis=0, ignore_index=True)
-
-# Save the combined data to a single master CSV file
-final_master_csv_path = 'master_student_data_aligned.csv'
-combined_df.to_csv(final_master_csv_path, index=False)
+    # Append the aligned rows to the master file
+    aligned_df.to_csv(final_master_csv_path, mode='a', header=False, index=False)
 
 print(f"Combined CSV file saved as {final_master_csv_path}")
@@ -14,13 +14,12 @@ Prerequisites and Dependencies:
     - Fully installed, activated, and licensed.
 - Install the Python library 'docx2pdf':
     pip install docx2pdf
-- LibreOffice and 'unoconv' for older '.doc' files or if Word isn't available:
+- LibreOffice for older '.doc' files or if Word isn't available:
     - Ubuntu/Linux:
-        sudo apt install libreoffice unoconv
+        sudo apt install libreoffice
     - Windows:
         - LibreOffice: https://www.libreoffice.org/download/download/
-        - unoconv: https://github.com/unoconv/unoconv
-        - Ensure LibreOffice and unoconv are in the PATH.
+        - Ensure LibreOffice's 'soffice' is in the PATH.
 
 Usage:
 Run script from the desired root directory. PDF files appear alongside original documents.
@@ -28,49 +27,138 @@ Run script from the desired root directory. PDF files appear alongside original
 
 import os
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 from docx2pdf import convert
 
+# Number of .doc files handed to a single LibreOffice run
+DOC_BATCH_SIZE = 50
+
+# Convert many .doc files in one LibreOffice run; PDFs are named after each input file
+def convert_docs_with_libreoffice(input_files, outdir):
+    # A private profile per run lets several LibreOffice instances work side by side
+    with tempfile.TemporaryDirectory() as profile_dir:
+        subprocess.run(['soffice', f'-env:UserInstallation={Path(profile_dir).as_uri()}',
+                        '--headless', '--convert-to', 'pdf', '--outdir', outdir, *input_files],
+                       check=True, stdout=subprocess.DEVNULL)
+
 # Conversion function
 def convert_to_pdf(input_file, output_file):
     ext = os.path.splitext(input_file)[1].lower()
     if ext == ".docx":
         convert(input_file, output_file)
     elif ext == ".doc":
-        subprocess.run(['unoconv', '-f', 'pdf', '-o', output_file, input_file], check=True)
+        convert_docs_with_libreoffice([input_file], os.path.dirname(output_file) or '.')
 
-# Find all Word documents to convert
+# Find all Word documents to convert (os.scandir reuses the file type from the directory
+# listing, so no extra stat call is needed per entry)
 def find_word_documents(root_dir):
-    word_files = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for file in filenames:
-            if file.lower().endswith((".doc", ".docx")):
-                word_files.append(os.path.join(dirpath, file))
-    return word_files
+    pending = [root_dir]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # unreadable directory: skip it, as os.walk did
+        with entries:
+            for entry in entries:
+                # Like os.walk: a link to a folder is a folder, not a file,
+                # but links are not followed into.
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                elif entry.name.lower().endswith((".doc", ".docx")):
+                    yield entry.path
+
+# Worker for a single file: returns the file, how long it took, and the error (if any)
+def _convert_worker(doc_path):
+    pdf_path = os.path.splitext(doc_path)[0] + ".pdf"
+    file_start_time = time.time()
+    try:
+        convert_to_pdf(doc_path, pdf_path)
+    except Exception as e:
+        return doc_path, None, e
+    return doc_path, time.time() - file_start_time, None
+
+# Modification time of a file, or None if it doesn't exist
+def _mtime_or_none(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+# Worker for a batch of .doc files from one directory: one result per file
+def _convert_doc_batch_worker(doc_paths):
+    pdf_paths = [os.path.splitext(doc_path)[0] + ".pdf" for doc_path in doc_paths]
+    # A PDF left over from an earlier run must not count as converted, so note what was
+    # there before and require a new or rewritten file afterwards
+    old_mtimes = [_mtime_or_none(pdf_path) for pdf_path in pdf_paths]
+    batch_start_time = time.time()
+    try:
+        convert_docs_with_libreoffice(doc_paths, os.path.dirname(doc_paths[0]))
+    except Exception as e:
+        return [(doc_path, None, e) for doc_path in doc_paths]
+
+    file_elapsed = (time.time() - batch_start_time) / len(doc_paths)
+    results = []
+    for doc_path, pdf_path, old_mtime in zip(doc_paths, pdf_paths, old_mtimes):
+        new_mtime = _mtime_or_none(pdf_path)
+        if new_mtime is not None and new_mtime != old_mtime:
+            results.append((doc_path, file_elapsed, None))
+        else:
+            results.append((doc_path, None, "LibreOffice did not produce a PDF"))
+    return results
 
 # Main conversion and progress tracking function
 def traverse_and_convert(root_dir):
-    word_files = find_word_documents(root_dir)
+    word_files = list(find_word_documents(root_dir))
     total_files = len(word_files)
     start_time = time.time()
+    done = 0
 
-    for idx, doc_path in enumerate(word_files, 1):
-        pdf_path = os.path.splitext(doc_path)[0] + ".pdf"
-        try:
-            file_start_time = time.time()
-            convert_to_pdf(doc_path, pdf_path)
-            file_elapsed = time.time() - file_start_time
+    def report(result):
+        nonlocal done
+        doc_path, file_elapsed, error = result
+        done += 1
+        if error is not None:
+            print(f"Conversion failed for {doc_path}. Reason: {error}")
+            return
+
+        total_elapsed = time.time() - start_time
+        iterations_per_minute = (done / total_elapsed) * 60 if total_elapsed > 0 else 0
+        percent_complete = (done / total_files) * 100
+
+        print(f"[{done}/{total_files}] {percent_complete:.2f}% | "
+              f"Current file: '{os.path.basename(doc_path)}' converted in {file_elapsed:.2f}s | "
+              f"Rate: {iterations_per_minute:.2f} files/min")
+
+    # .doc files are converted by LibreOffice. Files in the same directory are passed to a
+    # single LibreOffice run (its startup cost is paid once per batch, not once per file),
+    # and the batches run in parallel across all cores. .docx files go through Word (COM),
+    # which handles one document at a time, so they are converted here in the main process
+    # while the pool works.
+    doc_batches = {}
+    docx_files = []
+    for doc_path in word_files:
+        if doc_path.lower().endswith(".doc"):
+            doc_batches.setdefault(os.path.dirname(doc_path), []).append(doc_path)
+        else:
+            docx_files.append(doc_path)
 
-            total_elapsed = time.time() - start_time
-            iterations_per_minute = (idx / total_elapsed) * 60 if total_elapsed > 0 else 0
-            percent_complete = (idx / total_files) * 100
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_convert_doc_batch_worker, paths[i:i + DOC_BATCH_SIZE])
+            for paths in doc_batches.values()
+            for i in range(0, len(paths), DOC_BATCH_SIZE)
+        ]
 
-            print(f"[{idx}/{total_files}] {percent_complete:.2f}% | "
-                  f"Current file: '{os.path.basename(doc_path)}' converted in {file_elapsed:.2f}s | "
-                  f"Rate: {iterations_per_minute:.2f} files/min")
+        for doc_path in docx_files:
+            report(_convert_worker(doc_path))
 
-        except Exception as e:
-            print(f"Conversion failed for {doc_path}. Reason: {e}")
+        for future in as_completed(futures):
+            for result in future.result():
+                report(result)
 
 # Entry point
 if __name__ == "__main__":
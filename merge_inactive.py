@@ -1,27 +1,25 @@
 import pandas as pd
 
-# Load the CSV file
+# Load the CSV file into Arrow-backed columns; missing values are then tracked in compact
+# validity bitmaps, which makes the per-row non-null counts below much cheaper
 file_path = 'Master Inactive Students - master_student_data_aligned (1).csv'
-df = pd.read_csv(file_path)
+df = pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
 
 # Define a function to merge duplicates based on the most complete row per 'UNIQUE ID'
 def merge_duplicates(df, unique_id_col):
-    merged_rows = []
+    # Find each group's most complete row (most non-null values; the first one on a tie)
+    completeness = df.notna().sum(axis=1)
+    is_base = df.index.isin(completeness.groupby(df[unique_id_col]).idxmax())
 
-    # Group by 'UNIQUE ID' and process each group
-    for _, group in df.groupby(unique_id_col):
-        # Find the row with the most non-null values (most complete data)
-        most_complete_row = group.loc[group.notna().sum(axis=1).idxmax()]
+    # Put those rows first and leave every other row in its original file order
+    ordered = pd.concat([df[is_base], df[~is_base]])
 
-        # Fill in missing values in the most complete row with values from other rows in the group
-        for _, row in group.iterrows():
-            most_complete_row = most_complete_row.combine_first(row)
+    # For each 'UNIQUE ID', take every column's first non-null value: the most complete row,
+    # with its gaps filled in from the other rows in the group in file order
+    merged = ordered.groupby(unique_id_col, as_index=False).first()
 
-        # Append the merged row to the result list
-        merged_rows.append(most_complete_row)
-
-    # Convert the list of merged rows to a DataFrame
-    return pd.DataFrame(merged_rows)
+    # Keep the original column order
+    return merged[df.columns]
 
 # Apply the deduplication process
 deduped_df = merge_duplicates(df, unique_id_col='UNIQUE ID')
@@ -1,17 +1,104 @@
 import fitz  # PyMuPDF
+import pypdfium2 as pdfium
+import collections
 import difflib
+import multiprocessing
 import os
 import re
 
-def extract_text_by_paragraph(doc):
-    """Extract text from a PDF document, keeping paragraph integrity."""
+def extract_text_by_paragraph(pdf_path):
+    """Extract text from a PDF document, keeping paragraph integrity.
+
+    Uses PDFium's text extraction; PyMuPDF is kept for highlighting and page copies.
+    """
     text_content = []
-    for page in doc:
-        text = page.get_text("text")
-        paragraphs = text.split('\n\n')  # Splitting by double newlines to preserve paragraphs
-        text_content.extend([p.strip() for p in paragraphs if p.strip()])
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range().replace('\r\n', '\n')  # PDFium ends lines with CRLF
+            textpage.close()
+            page.close()
+            paragraphs = text.split('\n\n')  # Splitting by double newlines to preserve paragraphs
+            text_content.extend([p.strip() for p in paragraphs if p.strip()])
+    finally:
+        pdf.close()
     return text_content
 
+def diff_words(source_para, comparison_para):
+    """Return the (added, missing) words between two paragraphs.
+
+    Lines are aligned first and only the lines that differ are diffed word by word,
+    so a small change in a long paragraph doesn't cost a word diff of the whole thing.
+    """
+    source_lines = source_para.splitlines()
+    comparison_lines = comparison_para.splitlines()
+    line_matcher = difflib.SequenceMatcher(a=source_lines, b=comparison_lines)
+    
+    # The gaps between matching blocks are exactly the changed regions, so walking
+    # get_matching_blocks() finds them without building the full opcode list
+    added_words = []
+    missing_words = []
+    prev_i = prev_j = 0
+    for i, j, n in line_matcher.get_matching_blocks():
+        if i > prev_i or j > prev_j:
+            # Compute differences using difflib
+            source_words = ' '.join(source_lines[prev_i:i]).split()
+            comparison_words = ' '.join(comparison_lines[prev_j:j]).split()
+            matcher = difflib.SequenceMatcher(a=source_words, b=comparison_words)
+            
+            prev_wi = prev_wj = 0
+            for wi, wj, wn in matcher.get_matching_blocks():
+                missing_words.extend(source_words[prev_wi:wi])
+                added_words.extend(comparison_words[prev_wj:wj])
+                prev_wi, prev_wj = wi + wn, wj + wn
+        prev_i, prev_j = i + n, j + n
+    
+    return added_words, missing_words
+
+def diff_page(args):
+    """Diff one page's paragraphs; returns the rectangles to highlight and the omitted words.
+
+    Runs in a worker process, so it opens the comparison document by path itself
+    (PyMuPDF documents cannot be shared between processes).
+    """
+    comparison_path, page_num, source_paragraphs, comparison_paragraphs = args
+    
+    # Unchanged paragraphs need no diff; if nothing changed on this page, skip opening
+    # the document and extracting its words altogether
+    changed = [(source_para, comparison_para)
+               for source_para, comparison_para in zip(source_paragraphs, comparison_paragraphs)
+               if source_para != comparison_para]
+    if not changed:
+        return page_num, []
+    
+    with fitz.open(comparison_path) as comparison_doc:
+        comparison_page = comparison_doc[page_num]
+        
+        # Extract the page's words once and index their positions, so each added word is
+        # a dictionary lookup instead of a fresh search through the page layout
+        word_rects = collections.defaultdict(list)
+        for x0, y0, x1, y1, word, *_ in comparison_page.get_text("words"):
+            word_rects[word].append((x0, y0, x1, y1))
+        
+        def rects_for(word):
+            # The diff words come from PDFium, which can split text differently than
+            # PyMuPDF (e.g. around punctuation); search the page for those instead
+            if word not in word_rects:
+                word_rects[word] = [tuple(rect) for rect in comparison_page.search_for(word)]
+            return word_rects[word]
+        
+        results = []
+        for source_para, comparison_para in changed:
+            added_words, missing_words = diff_words(source_para, comparison_para)
+            
+            # Dedupe once at the end; each word's rectangles already cover every occurrence
+            added_rects = [rect for word in set(added_words) for rect in rects_for(word)]
+            results.append((added_rects, list(set(missing_words))))
+    
+    return page_num, results
+
 def compare_documents():
     print("\n--- Document Comparison Tool ---")
     
@@ -27,55 +114,47 @@ def compare_documents():
         print(f"Error: Comparison file not found at {comparison_path}")
         return
     
-    # Open the documents
+    # Open the documents; the results are written onto a copy of the comparison document
+    # (annotated in place, so its pages don't have to be re-embedded into a new file)
     source_doc = fitz.open(source_path)
-    comparison_doc = fitz.open(comparison_path)
+    output_doc = fitz.open(comparison_path)
     
     # Extract paragraphs from both documents
-    source_text = extract_text_by_paragraph(source_doc)
-    comparison_text = extract_text_by_paragraph(comparison_doc)
+    source_text = extract_text_by_paragraph(source_path)
+    comparison_text = extract_text_by_paragraph(comparison_path)
     
-    # Create a new document for results
-    output_doc = fitz.open()
+    # Diff the pages in parallel worker processes; the results are applied to the
+    # output document here, in page order, since it can only be changed from one process
+    page_count = min(len(source_doc), len(output_doc))
+    jobs = [
+        (comparison_path, page_num,
+         source_text[page_num: page_num+1],  # Slice to get page-wise text
+         comparison_text[page_num: page_num+1])
+        for page_num in range(page_count)
+    ]
+    with multiprocessing.Pool(min(os.cpu_count() or 1, 4)) as pool:
+        page_results = pool.map(diff_page, jobs)
     
     # Iterate through paragraphs for structured comparison
-    for page_num in range(min(len(source_doc), len(comparison_doc))):
-        source_page = source_doc[page_num]
-        comparison_page = comparison_doc[page_num]
-
-        # Create a new page for results
-        new_page = output_doc.new_page(width=comparison_page.rect.width, height=comparison_page.rect.height)
-        new_page.show_pdf_page(new_page.rect, comparison_doc, page_num)
-        
-        # Compare corresponding paragraphs
-        source_paragraphs = source_text[page_num: page_num+1]  # Slice to get page-wise text
-        comparison_paragraphs = comparison_text[page_num: page_num+1]
+    for page_num, results in page_results:
+        new_page = output_doc[page_num]
         
-        for source_para, comparison_para in zip(source_paragraphs, comparison_paragraphs):
-            # Compute differences using difflib
-            diff = list(difflib.ndiff(source_para.split(), comparison_para.split()))
-            
-            added_words = {word[2:] for word in diff if word.startswith('+ ')}
-            missing_words = {word[2:] for word in diff if word.startswith('- ')}
-            
+        for added_rects, missing_words in results:
             # Highlight added words in current document
-            for word in added_words:
-                text_instances = new_page.search_for(word)
-                for inst in text_instances:
-                    highlight = new_page.add_highlight_annot(inst)
-                    highlight.set_colors(stroke=(1, 0.75, 0.8))  # Pink highlight
+            for rect in added_rects:
+                highlight = new_page.add_highlight_annot(fitz.Rect(rect))
+                highlight.set_colors(stroke=(1, 0.75, 0.8))  # Pink highlight
             
             # Annotate missing words
             if missing_words:
-                annotation_text = f"Omitted words: {', '.join(list(missing_words)[:10])}..."
+                annotation_text = f"Omitted words: {', '.join(missing_words[:10])}..."
                 new_page.insert_text((50, 50), annotation_text, fontsize=10, color=(1, 0, 0))
     
     # Save the output document
     output_path = os.path.join(os.getcwd(), "Comparison_Result.pdf")
-    output_doc.save(output_path)
+    output_doc.save(output_path, garbage=3, deflate=True)
     output_doc.close()
     source_doc.close()
-    comparison_doc.close()
     
     print(f"\nComparison completed. Output saved to {output_path}")
 
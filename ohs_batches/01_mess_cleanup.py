@@ -11,9 +11,9 @@ What this script does
 3. Finds all files that end with ".ini" or ".db".
 4. Counts how many such files exist.
 5. Announces how many it will delete.
-6. Deletes them one by one.
-7. While deleting, shows progress in the form: [x/N] Deleted: filename
-   where x is the number deleted so far and N is the total number.
+6. Deletes them in batches of 256, several files at a time on background threads.
+7. After each batch, shows progress in the form: [x/N] Deleted: filename
+   where x is the number of files handled so far and N is the total number.
 
 Important notes
 ---------------
@@ -24,13 +24,51 @@ Important notes
 """
 
 # We import the modules (collections of ready-made code) we need.
-import os       # lets us walk through folders and files
+import os       # lets us walk through folders and delete files
 import sys      # lets us print progress on the same line
+from concurrent.futures import ThreadPoolExecutor  # lets several deletions wait on the disk at once
 from pathlib import Path  # easier and safer way to handle file/folder paths
 
 # Define which file types we want to remove.
-# ".ini" and ".db" are the two file extensions.
-TARGET_EXTS = {".ini", ".db"}
+# "ini" and "db" are the two file extensions (written without the dot,
+# so we can compare them directly with the text after the last dot).
+TARGET_EXTS = frozenset({"ini", "db"})
+
+# How many files we hand to the deleting threads at a time.
+# Progress is printed once per batch instead of once per file.
+BATCH_SIZE = 256
+
+def walk_files(root):
+    """
+    Go through 'root' and every folder below it, and hand back each file found.
+
+    os.scandir already knows from the folder listing whether an entry is a
+    file or a folder, so no extra disk lookup is needed per entry.
+
+    Parameters
+    ----------
+    root : Path or str
+        The folder where we begin our search.
+
+    Yields
+    ------
+    entry : os.DirEntry
+        One file; entry.name is its name and entry.path its full path.
+    """
+    folders = [root]  # folders we still need to look inside
+
+    while folders:
+        folder = folders.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(entry.path)  # look inside this one later
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            # Folder could not be read (for example, permission denied); skip it
+            continue
 
 def find_targets(root: Path):
     """
@@ -44,29 +82,47 @@ def find_targets(root: Path):
 
     Returns
     -------
-    targets : list of Path objects
-        Each item is a file path that should be deleted.
+    targets : list of str
+        Each item is the full path of a file that should be deleted.
     """
     targets = []  # an empty list to store all matches we find
 
-    # os.walk goes through every folder and subfolder step by step
-    for dirpath, dirnames, filenames in os.walk(root):
-        for fname in filenames:
-            fpath = Path(dirpath) / fname  # full path to this file
-            # Check if the file’s extension (suffix) is either .ini or .db
-            if fpath.suffix.lower() in TARGET_EXTS:
-                targets.append(fpath)  # add this file to our list
+    # walk_files goes through every folder and subfolder step by step
+    for entry in walk_files(root):
+        # Check if the file’s extension is either .ini or .db
+        # (i > 0 skips names like ".db" that only start with a dot)
+        name = entry.name
+        i = name.rfind(".")
+        if i > 0 and name[i + 1:].lower() in TARGET_EXTS:
+            targets.append(entry.path)  # add this file to our list
 
     return targets  # send back the list of files to delete
 
+def try_delete(fpath):
+    """
+    Delete one file.
+
+    Returns None if it worked, or the error if it did not
+    (file in use, permission denied, etc.).
+    """
+    try:
+        os.unlink(fpath)
+        return None
+    except Exception as e:
+        return e
+
 def delete_files(files):
     """
     Delete each file in the 'files' list and show progress.
 
+    Deletions are handed to a small pool of threads, one batch at a time.
+    Each deletion mostly waits on the disk (or network share), so several
+    of them can be waiting at once instead of strictly one after another.
+
     Parameters
     ----------
-    files : list of Path objects
-        The list of files we want to delete.
+    files : list of str
+        The full paths of the files we want to delete.
     """
     total = len(files)  # how many files we need to delete
 
@@ -79,20 +135,26 @@ def delete_files(files):
     print(f"Deleting {total} file(s)...")
 
     deleted = 0  # counter of how many we actually removed
+    last_deleted = None  # most recent file removed, shown in the progress line
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        # Go through the files one batch at a time
+        for start in range(0, total, BATCH_SIZE):
+            batch = files[start:start + BATCH_SIZE]
+
+            # pool.map deletes the whole batch and gives back the results in the same order
+            # enumerate gives us both a counter (idx) and the file itself (fpath)
+            for idx, (fpath, error) in enumerate(zip(batch, pool.map(try_delete, batch)), start=start + 1):
+                if error is None:
+                    deleted += 1
+                    last_deleted = fpath
+                else:
+                    # If deleting failed, say so on its own line
+                    sys.stdout.write(f"\r[{idx}/{total}] Failed to delete {fpath}: {error}\n")
 
-    # Go through each file one by one
-    # enumerate gives us both a counter (idx) and the file itself (fpath)
-    for idx, fpath in enumerate(files, start=1):
-        try:
-            # Try to remove the file from disk
-            fpath.unlink()
-            deleted += 1
             # Print progress on the same line, overwriting as we go
-            sys.stdout.write(f"\r[{idx}/{total}] Deleted: {fpath}")
-            sys.stdout.flush()
-        except Exception as e:
-            # If deleting fails (file in use, permission denied, etc.)
-            sys.stdout.write(f"\r[{idx}/{total}] Failed to delete {fpath}: {e}\n")
+            if last_deleted is not None:
+                sys.stdout.write(f"\r[{idx}/{total}] Deleted: {last_deleted}")
             sys.stdout.flush()
 
     # When the loop finishes, move to a new line and show summary
@@ -8,6 +8,7 @@ Behavior
 - Exports each to a same-name .pdf next to the source.
 - Deletes the source file only after a successful conversion.
 - Skips items whose target PDF already exists.
+- Converts with up to 4 Word instances in parallel (one per worker process).
 - Shows a running progress bar.
 - --dry-run performs no conversion and no deletion.
 
@@ -25,24 +26,47 @@ Usage
 import os
 import sys
 import argparse
+import time
+import multiprocessing
+import multiprocessing.util
 from pathlib import Path
-from typing import Iterable, Tuple, List
+from typing import Iterator, Tuple, List
 
-DOC_EXTS = {".doc", ".docx", ".rtf"}
-HTML_EXTS = {".htm", ".html"}
+# Extensions without the leading dot, matched against the text after a file name's last dot
+DOC_EXTS = frozenset({"doc", "docx", "rtf"})
+HTML_EXTS = frozenset({"htm", "html"})
 ALL_EXTS = DOC_EXTS | HTML_EXTS
 TARGET_EXT = ".pdf"
 
 # ---------- discovery ----------
 
+def walk_files(root) -> Iterator[os.DirEntry]:
+    """
+    Yield every file under root recursively.
+    Uses os.scandir so file/dir checks come from the cached directory entry, not a stat per file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.is_file(follow_symlinks=False):
+                        yield e
+        except OSError:
+            continue  # unreadable folder
+
 def find_eligible(root: Path) -> List[Path]:
     """
     Return a list of eligible files under root recursively.
     """
     files: List[Path] = []
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in ALL_EXTS:
-            files.append(p)
+    for e in walk_files(root):
+        name = e.name
+        i = name.rfind(".")
+        if i > 0 and name[i + 1:].lower() in ALL_EXTS:
+            files.append(Path(e.path))
     return files
 
 def target_path(src: Path) -> Path:
@@ -50,12 +74,21 @@ def target_path(src: Path) -> Path:
 
 # ---------- progress bar ----------
 
+_last_done = -1
+_last_drawn = 0.0
+
 def render_progress(done: int, total: int, width: int = 40, prefix: str = "Progress") -> None:
     """
     Simple in-place progress bar: [#####.....] 12/100
+    Redraws at most every 0.1% of total or every 50 ms; the final update always draws.
     """
+    global _last_done, _last_drawn
     if total <= 0:
         total = 1
+    now = time.monotonic()
+    if done != total and done - _last_done < max(total // 1000, 1) and now - _last_drawn < 0.05:
+        return
+    _last_done, _last_drawn = done, now
     ratio = min(max(done / total, 0.0), 1.0)
     filled = int(ratio * width)
     bar = "#" * filled + "." * (width - filled)
@@ -83,7 +116,15 @@ def convert_one(word_app, src: Path, dst: Path, dry_run: bool) -> Tuple[bool, st
     doc = None
     try:
         # ReadOnly avoids prompts. ConfirmConversions False, AddToRecentFiles False.
-        doc = word_app.Documents.Open(str(src), ReadOnly=True)
+        # Visible False skips drawing a window; OpenAndRepair False skips the repair pass.
+        doc = word_app.Documents.Open(
+            str(src),
+            ConfirmConversions=False,
+            ReadOnly=True,
+            AddToRecentFiles=False,
+            Visible=False,
+            OpenAndRepair=False
+        )
         # 17 = wdExportFormatPDF; OptimizeFor=0 print quality; CreateBookmarks=1 headings
         doc.ExportAsFixedFormat(
             OutputFileName=str(dst),
@@ -102,6 +143,110 @@ def convert_one(word_app, src: Path, dst: Path, dry_run: bool) -> Tuple[bool, st
             pass
         return False, f"word-error: {e}"
 
+# ---------- worker processes ----------
+
+# Each worker process drives its own Word.Application, so conversions run side by side.
+_worker_word = None
+_worker_word_error = ""
+_worker_saved_options: dict = {}
+
+# Word-wide options that add background work (spelling/grammar checks, repagination, ...)
+# to every opened document. They are stored in the user's Word settings, so main() records
+# the user's values once. Each worker puts them back before quitting, and main() sets them
+# again at the very end (workers stopped by pool.terminate() never get to quit).
+QUIET_OPTIONS = {
+    "CheckSpellingAsYouType": False,
+    "CheckGrammarAsYouType": False,
+    "SuggestSpellingCorrections": False,
+    "Pagination": False,
+    "BackgroundSave": False,
+}
+
+def read_word_options(word) -> dict:
+    saved = {}
+    for name in QUIET_OPTIONS:
+        try:
+            saved[name] = getattr(word.Options, name)
+        except Exception:
+            pass
+    return saved
+
+def set_word_options(word, values: dict) -> None:
+    options = word.Options
+    for name, value in values.items():
+        try:
+            setattr(options, name, value)
+        except Exception:
+            pass
+
+def start_word():
+    """
+    Start a private, quiet Word instance for this process.
+    """
+    import win32com.client
+    word = win32com.client.DispatchEx("Word.Application")
+
+    # Early binding: the makepy wrapper calls methods/properties by DISPID
+    # instead of resolving each name through IDispatch on every call.
+    # Wrap the instance we just started (EnsureDispatch on the ProgID would attach to a running Word).
+    try:
+        import win32com.client.gencache
+        word = win32com.client.gencache.EnsureDispatch(word._oleobj_)
+    except Exception:
+        pass  # stay late-bound; slower per call but works the same
+
+    # Quiet Word
+    try:
+        word.Visible = False
+        word.DisplayAlerts = 0
+    except Exception:
+        pass
+    return word
+
+def quit_word(word, options: dict) -> None:
+    """
+    Put the given Word options back and quit without prompting.
+    """
+    try:
+        set_word_options(word, options)
+        word.NormalTemplate.Saved = True  # no "save changes to Normal.dotm?" prompt
+    except Exception:
+        pass
+    try:
+        word.Quit()
+    except Exception:
+        pass
+
+def _quit_worker_word() -> None:
+    quit_word(_worker_word, _worker_saved_options)
+
+def init_worker(dry_run: bool, saved_options: dict) -> None:
+    """
+    Pool initializer: start this worker's Word (not needed for a dry run).
+    Word is quit when the worker exits after pool.close()/join().
+    """
+    global _worker_word, _worker_word_error, _worker_saved_options
+    if dry_run:
+        return
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+        _worker_word = start_word()
+        _worker_saved_options = saved_options
+        set_word_options(_worker_word, QUIET_OPTIONS)
+    except Exception as e:
+        # Don't raise here: the pool would keep restarting the worker. Report per file instead.
+        _worker_word_error = f"word-error: cannot start Word: {e}"
+        return
+    multiprocessing.util.Finalize(None, _quit_worker_word, exitpriority=10)
+
+def convert_in_worker(job: Tuple[Path, bool]) -> Tuple[Path, bool, str]:
+    src, dry_run = job
+    if _worker_word_error:
+        return src, False, _worker_word_error
+    ok, info = convert_one(_worker_word, src, target_path(src), dry_run)
+    return src, ok, info
+
 # ---------- main ----------
 
 def main():
@@ -124,7 +269,9 @@ def main():
         return
     print(f"Found {total} eligible files")
 
-    # Import pywin32 and start Word
+    # Check pywin32 and Word are available before starting workers,
+    # and record the user's Word options so they can be restored at the end.
+    # This Word stays open until then, so the restore runs here even if the workers are terminated.
     try:
         import win32com.client
     except Exception:
@@ -132,17 +279,11 @@ def main():
         sys.exit(3)
 
     try:
-        word = win32com.client.DispatchEx("Word.Application")
+        word = start_word()
     except Exception:
         print("ERROR: Cannot start Word via COM. Is Microsoft Word installed?", file=sys.stderr)
         sys.exit(4)
-
-    # Quiet Word
-    try:
-        word.Visible = False
-        word.DisplayAlerts = 0
-    except Exception:
-        pass
+    saved_options = read_word_options(word)
 
     converted = 0
     skipped_pdf_exists = 0
@@ -153,34 +294,41 @@ def main():
     done = 0
     render_progress(done, total)
 
-    for src in workload:
-        dst = target_path(src)
-        ok, info = convert_one(word, src, dst, args.dry_run)
-        if ok:
-            converted += 1
-            # Delete source only if we actually exported a new PDF, not when skipping due to existing PDF, and not in dry-run
-            if not args.dry_run:
-                try:
-                    src.unlink()
-                except Exception as e:
-                    # Non-fatal: record but continue
-                    failures.append((src, f"delete-failed: {e}"))
-                    failed += 1
-        else:
-            if info == "pdf-exists":
-                skipped_pdf_exists += 1
+    # Convert across several worker processes, each with its own Word instance.
+    # Source deletion and bookkeeping stay here in the main process.
+    num_workers = min(os.cpu_count() or 1, 4, total)
+    pool = multiprocessing.Pool(num_workers, initializer=init_worker, initargs=(args.dry_run, saved_options))
+    try:
+        jobs = [(src, args.dry_run) for src in workload]
+        for src, ok, info in pool.imap_unordered(convert_in_worker, jobs):
+            if ok:
+                converted += 1
+                # Delete source only if we actually exported a new PDF, not when skipping due to existing PDF, and not in dry-run
+                if not args.dry_run:
+                    try:
+                        src.unlink()
+                    except Exception as e:
+                        # Non-fatal: record but continue
+                        failures.append((src, f"delete-failed: {e}"))
+                        failed += 1
             else:
-                failed += 1
-                failures.append((src, info))
-
-        done += 1
-        render_progress(done, total)
+                if info == "pdf-exists":
+                    skipped_pdf_exists += 1
+                else:
+                    failed += 1
+                    failures.append((src, info))
 
-    # Cleanup Word
-    try:
-        word.Quit()
-    except Exception:
-        pass
+            done += 1
+            render_progress(done, total)
+    except BaseException:
+        pool.terminate()  # interrupted or crashed: stop the workers now
+        raise
+    finally:
+        # close/join (not terminate) so each worker exits normally and quits its Word
+        pool.close()
+        pool.join()
+        # Quit last, so the user's options are the last ones Word saves
+        quit_word(word, saved_options)
 
     # Summary
     print("Summary")
@@ -37,6 +37,33 @@ Usage
 import os
 from pathlib import Path
 
+def walk_dirs(root: Path):
+    """
+    Yield (folder_path, file_names) for 'root' and every folder below it,
+    each folder before its subfolders (the same order os.walk uses).
+
+    os.scandir reports file vs. folder straight from the directory listing,
+    so no extra disk lookup is made per entry.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        subdirs, filenames = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for e in it:
+                    # Like os.walk: a link to a folder is a folder, not a file,
+                    # but links are not followed into.
+                    if e.is_dir():
+                        if not e.is_symlink():
+                            subdirs.append(e.path)
+                    else:
+                        filenames.append(e.name)
+        except OSError:
+            continue  # unreadable folder
+        yield dirpath, filenames
+        stack.extend(reversed(subdirs))
+
 def rename_files(root: Path, dry_run: bool = True):
     """
     Crawl through 'root' recursively and rename files.
@@ -51,28 +78,26 @@ def rename_files(root: Path, dry_run: bool = True):
     """
 
     # Walk through every folder and file inside 'root'
-    for dirpath, dirnames, filenames in os.walk(root):
-        parent = Path(dirpath)
-
+    root_str = str(root)
+    for dirpath, filenames in walk_dirs(root):
         # Skip the root folder itself; only rename inside subfolders
-        if parent == root:
+        if dirpath == root_str:
             continue
 
-        # Take the first 7 characters of the folder name
-        prefix = parent.name[:7]
+        # Take the first 7 characters of the folder name (once per folder, not per file)
+        prefix = os.path.basename(dirpath)[:7]
 
         # Process each file in this subfolder
+        # (plain string paths: building Path objects per file is much slower)
         for fname in filenames:
-            src = parent / fname   # the current file
-            stem = src.stem        # filename without extension
-            ext = src.suffix       # extension, like ".docx"
+            src = os.path.join(dirpath, fname)   # the current file
 
-            # Build new filename: prefix + original filename + extension
-            new_name = f"{prefix}{stem}{ext}"
-            dst = parent / new_name
+            # Build new filename: prefix + original filename (stem + extension)
+            new_name = prefix + fname
+            dst = os.path.join(dirpath, new_name)
 
             # If a file with the new name already exists, skip it
-            if dst.exists():
+            if os.path.exists(dst):
                 print(f"SKIP (would overwrite): {src} -> {dst}")
                 continue
 
@@ -81,7 +106,7 @@ def rename_files(root: Path, dry_run: bool = True):
                 print(f"Would rename: {src} -> {dst}")
             else:
                 print(f"Renaming: {src} -> {dst}")
-                src.rename(dst)
+                os.rename(src, dst)
 
 if __name__ == "__main__":
     # Folder where script is run
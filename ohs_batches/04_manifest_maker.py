@@ -20,13 +20,33 @@ Outputs (in the folder you run this from)
 """
 
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Optional
+import zipfile
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
 import csv
 
+# Optional: use ISA-L's SIMD deflate/CRC32 (pip install isal). isal_zlib mirrors the
+# zlib functions zipfile calls, so zipfile uses it transparently; falls back to zlib.
+# zipfile keeps its own reference to crc32 from import time, so that one is replaced too.
+try:
+    from isal import isal_zlib
+    zipfile.zlib = isal_zlib
+    zipfile.crc32 = isal_zlib.crc32
+except ImportError:
+    pass
+
 ZIP_NAME = "combined_files.zip"
 MANIFEST_NAME = "veracross-mapping-file.csv"
-SEP_SET = {"_", "-", " "}  # separators to strip if they follow the marker
+SEPARATORS = "_- "  # separators to strip if they follow the marker
+READ_AHEAD = 8  # files read in the background while the current one is compressed
+READ_AHEAD_MAX_BYTES = 16 << 20  # bigger files are streamed from disk instead, so at most ~128 MiB is held
+# Formats that are already compressed; deflating them again costs CPU and saves ~nothing
+PRECOMPRESSED = {".pdf", ".docx", ".xlsx", ".pptx", ".zip", ".jpg", ".jpeg", ".png", ".gif", ".mp4"}
+COMPRESS_LEVEL = 1  # fastest deflate level for everything else
+MANIFEST_BUFFER = 1 << 20  # 1 MiB write buffer: manifest rows reach the disk in few large writes
 
 def unique_name(name: str, used: set[str]) -> str:
     """Ensure 'name' is unique within 'used' by appending _N before the extension."""
@@ -42,6 +62,34 @@ def unique_name(name: str, used: set[str]) -> str:
             return candidate
         n += 1
 
+def read_if_small(path) -> Optional[bytes]:
+    """Return the file's bytes, or None if it is bigger than READ_AHEAD_MAX_BYTES."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > READ_AHEAD_MAX_BYTES:
+            return None
+        return f.read()
+
+def read_ahead(paths, depth: int = READ_AHEAD):
+    """
+    Yield (path, file_bytes) in order, reading up to 'depth' files ahead on background threads
+    so disk reads overlap with compression of the current file.
+    file_bytes is None for files over READ_AHEAD_MAX_BYTES; the caller streams those itself.
+    """
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        pending = deque()
+        for p in paths:
+            pending.append((p, ex.submit(read_if_small, p)))
+            if len(pending) == depth:
+                break
+        while pending:
+            p, fut = pending.popleft()
+            data = fut.result()
+            nxt = next(paths, None)
+            if nxt is not None:
+                pending.append((nxt, ex.submit(read_if_small, nxt)))
+            yield p, data
+
 def derive_description(filename_stem: str, parent_name: str, rid6: str) -> str:
     """
     Remove a leading folder marker from filename_stem.
@@ -50,38 +98,60 @@ def derive_description(filename_stem: str, parent_name: str, rid6: str) -> str:
       2) first 6 chars (record id)
     After removing, strip leading separators. Return remaining text (may be '').
     """
-    s = filename_stem
+    # Try full parent name first, else the 6-char record id
+    s = filename_stem.removeprefix(parent_name)
+    if s == filename_stem:
+        s = filename_stem.removeprefix(rid6)
 
-    # Try full parent name first
-    if s.startswith(parent_name):
-        s = s[len(parent_name):]
-    # Else try the 6-char record id
-    elif s.startswith(rid6):
-        s = s[len(rid6):]
+    # Strip leading separators
+    return s.lstrip(SEPARATORS)  # may be empty
 
-    # Strip leading separators repeatedly
-    while s and s[0] in SEP_SET:
-        s = s[1:]
+def walk_dirs(root: Path):
+    """
+    Yield (folder_path, file_names) for 'root' and every folder below it,
+    each folder before its subfolders (the same order os.walk uses).
 
-    return s  # may be empty
+    os.scandir reports file vs. folder straight from the directory listing,
+    so no extra disk lookup is made per entry.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        subdirs, filenames = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for e in it:
+                    # Like os.walk: a link to a folder is a folder, not a file,
+                    # but links are not followed into.
+                    if e.is_dir():
+                        if not e.is_symlink():
+                            subdirs.append(e.path)
+                    else:
+                        filenames.append(e.name)
+        except OSError:
+            continue  # unreadable folder
+        yield dirpath, filenames
+        stack.extend(reversed(subdirs))
 
 def main():
     root = Path.cwd()
 
     # Collect all files under subdirectories
-    workload: list[tuple[Path, str, str]] = []  # (file_path, record_id, description)
-    for dirpath, dirnames, filenames in os.walk(root):
-        parent = Path(dirpath)
-        if parent == root:
+    # (plain string paths: building Path objects per file is much slower)
+    workload: list[tuple[str, str, str, str]] = []  # (file_path, file_name, record_id, description)
+    root_str = str(root)
+    for dirpath, filenames in walk_dirs(root):
+        if dirpath == root_str:
             continue  # exclude files at the root
-        rid6 = parent.name[:6]
+        parent_name = os.path.basename(dirpath)  # once per folder, not per file
+        rid6 = parent_name[:6]
         for fname in filenames:
-            src = parent / fname
-            if src.name in {ZIP_NAME, MANIFEST_NAME} and parent == root:
+            src = os.path.join(dirpath, fname)
+            if fname in {ZIP_NAME, MANIFEST_NAME} and dirpath == root_str:
                 continue
-            stem = src.stem
-            desc = derive_description(stem, parent.name, rid6)
-            workload.append((src, rid6, desc))
+            stem = os.path.splitext(fname)[0]
+            desc = derive_description(stem, parent_name, rid6)
+            workload.append((src, fname, rid6, desc))
 
     if not workload:
         print("No files found in subdirectories.")
@@ -92,13 +162,21 @@ def main():
     manifest_path = root / MANIFEST_NAME
 
     with ZipFile(zip_path, mode="w", compression=ZIP_DEFLATED) as zf, \
-         open(manifest_path, "w", newline="", encoding="utf-8") as mf:
+         open(manifest_path, "w", newline="", encoding="utf-8", buffering=MANIFEST_BUFFER) as mf:
         writer = csv.writer(mf)
         writer.writerow(["filename", "record_id", "description"])
 
-        for src, rid, desc in workload:
-            final_name = unique_name(src.name, used_names)
-            zf.write(src, arcname=final_name)  # flat placement
+        contents = read_ahead(src for src, _, _, _ in workload)
+        for (src, fname, rid, desc), (_, data) in zip(workload, contents):
+            final_name = unique_name(fname, used_names)
+            ext = os.path.splitext(fname)[1]
+            compress_type = ZIP_STORED if ext.lower() in PRECOMPRESSED else ZIP_DEFLATED
+            if data is None:
+                # Large file: let zipfile copy it in chunks rather than holding it in memory
+                zf.write(src, arcname=final_name, compress_type=compress_type, compresslevel=COMPRESS_LEVEL)
+            else:
+                zinfo = ZipInfo.from_file(src, arcname=final_name)  # flat placement, keeps the file's timestamp
+                zf.writestr(zinfo, data, compress_type=compress_type, compresslevel=COMPRESS_LEVEL)
             writer.writerow([final_name, rid, desc])
 
     print(f"Created: {zip_path.name}")
@@ -9,7 +9,8 @@ What this script does
 You run this script inside a TOP folder. It scans EVERY subfolder under it
 (files directly in TOP are ignored).
 
-For each file in each subfolder, it performs TWO PASSES:
+For each file in each subfolder, it performs TWO PASSES (worked out together,
+so each file is renamed at most once):
 
 PASS 1: REMOVE
   - Take the first 7 characters of the file's *immediate* parent folder name.
@@ -39,13 +40,23 @@ Apply changes:
 
 import os
 import sys
+import time
 import argparse
-from pathlib import Path
-from typing import List, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
+
+# How many folder listings / renames may be waiting on the filesystem at the same time.
+SCAN_WORKERS = 32
+RENAME_WORKERS = 32
 
 # ----------------------------
 # Console progress bar utility
 # ----------------------------
+_last_drawn = 0.0  # time.monotonic() of the last redraw
+_MAX_WIDTH = 64
+_HASHES = "#" * _MAX_WIDTH  # built once; each redraw just slices these
+_DOTS = "." * _MAX_WIDTH
+
 def render_progress(done: int, total: int, phase: str, extra: str = "", width: int = 40) -> None:
     """
     Draw a single-line progress bar:
@@ -62,12 +73,22 @@ def render_progress(done: int, total: int, phase: str, extra: str = "", width: i
     extra : str
         Additional short status text to display to the right.
     width : int
-        Visual width of the bar.
+        Visual width of the bar (at most 64 characters).
+
+    Writing to the console for every file is slow on big trees (and over
+    SSH), so the bar is only redrawn every 1/200th of the total or every
+    50 ms. The first and last call of each phase always draw.
     """
+    global _last_drawn
     total = max(total, 1)  # avoid division by zero
+    now = time.monotonic()
+    if 0 < done < total and done % max(total // 200, 1) and now - _last_drawn < 0.05:
+        return
+    _last_drawn = now
+    width = min(width, _MAX_WIDTH)
     ratio = min(max(done / total, 0.0), 1.0)
     filled = int(ratio * width)
-    bar = "#" * filled + "." * (width - filled)
+    bar = _HASHES[:filled] + _DOTS[:width - filled]
     msg = f"\r[{bar}] {done}/{total} | phase={phase}"
     if extra:
         msg += f" | {extra}"
@@ -79,42 +100,57 @@ def render_progress(done: int, total: int, phase: str, extra: str = "", width: i
 # --------------------------
 # Safe unique destination path
 # --------------------------
-def unique_path(dst: Path) -> Path:
+def unique_path(parent: str, stem: str, ext: str, taken: Dict[str, Set[str]]) -> str:
     """
-    Ensure we do not overwrite. If 'dst' exists, append _1, _2, ...
+    Ensure we do not overwrite. If stem+ext is already used in 'parent' (on
+    disk, or by another file planned to move there), append _1, _2, ...
     before the extension until unique, then return that path.
+
+    'taken' caches the names in use per folder. Each folder is listed once
+    with os.listdir the first time it is needed, so checking a candidate
+    name is a set lookup instead of an os.path.exists() call.
     """
-    if not dst.exists():
-        return dst
-    stem, ext = dst.stem, dst.suffix
+    names = taken.get(parent)
+    if names is None:
+        # normcase so "A.txt" and "a.txt" count as the same name on Windows
+        names = taken[parent] = {os.path.normcase(n) for n in os.listdir(parent)}
+    name = stem + ext
     n = 1
-    while True:
-        candidate = dst.with_name(f"{stem}_{n}{ext}")
-        if not candidate.exists():
-            return candidate
+    while os.path.normcase(name) in names:
+        name = f"{stem}_{n}{ext}"
         n += 1
+    names.add(os.path.normcase(name))
+    return parent + os.sep + name
 
 # -------------------------------------
 # Helpers for string and name processing
 # -------------------------------------
-SEP_SET = {"_", "-", " ", "."}  # characters we strip if they lead a name
+SEPARATORS = "_- ."  # characters we strip if they lead a name
 
 def strip_leading_separators(s: str) -> str:
     """
     Remove leading separator characters repeatedly: _, -, space, or dot.
     Example: "__- file" -> "file"
     """
-    i = 0
-    while i < len(s) and s[i] in SEP_SET:
-        i += 1
-    return s[i:]
+    return s.lstrip(SEPARATORS)
+
+def split_name(fname: str) -> Tuple[str, str]:
+    """
+    Split a filename into (stem, extension) the same way pathlib does:
+    "report.final.pdf" -> ("report.final", ".pdf"), ".hidden" -> (".hidden", "").
+    Plain string slicing is much cheaper than building a Path for every file.
+    """
+    dot = fname.rfind(".")
+    if dot > 0:
+        return fname[:dot], fname[dot:]
+    return fname, ""
 
 def remove_all_key_occurrences(stem: str, key: str) -> Tuple[str, int]:
     """
     Remove ALL non-overlapping occurrences of 'key' from 'stem'.
     Return (new_stem, removed_count).
     """
-    if not key:
+    if not key or key not in stem:
         return stem, 0
     count = stem.count(key)
     if count == 0:
@@ -125,108 +161,153 @@ def remove_all_key_occurrences(stem: str, key: str) -> Tuple[str, int]:
 # ------------------------
 # Workload construction
 # ------------------------
-def collect_files_under_subfolders(root: Path) -> List[Path]:
+def scan_dir(d: str) -> Tuple[str, List[str], List[str]]:
+    """
+    List ONE folder with os.scandir and return (folder, filenames, subfolders).
+    os.scandir already knows whether each entry is a folder, so this avoids
+    the extra stat() calls os.walk + pathlib would make.
     """
-    Build a list of Path objects for every file that resides in a subfolder
-    of 'root'. Files directly in 'root' are skipped.
+    names: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                # Like os.walk: a link to a folder is a folder, not a file,
+                # but links are not followed into.
+                if e.is_dir():
+                    if not e.is_symlink():
+                        subdirs.append(e.path)
+                else:
+                    names.append(e.name)
+    except OSError as e:
+        sys.stdout.write(f"\nWARNING: cannot read {d}: {e}\n")
+    return d, names, subdirs
+
+def collect_files_under_subfolders(root: str) -> Dict[str, Tuple[str, List[str]]]:
     """
-    files: List[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        parent = Path(dirpath)
-        if parent == root:
-            # Skip top-level files. Only process files inside subfolders.
-            continue
-        for fname in filenames:
-            files.append(parent / fname)
-    return files
-
-def folder_key_for(file_path: Path) -> str:
+    Group every file that resides in a subfolder of 'root' by its folder:
+        {parent_folder: (KEY, [filename, ...])}
+    Files directly in 'root' are skipped. KEY is worked out once per folder
+    here instead of once per file later on.
+
+    Folders are listed by a pool of threads: on a network share most of the
+    time goes into waiting for each directory listing, so listing many
+    folders at once finishes the walk much sooner.
+    """
+    groups: Dict[str, Tuple[str, List[str]]] = {}
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending = {pool.submit(scan_dir, root)}
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                d, names, subdirs = fut.result()
+                if d != root and names:  # skip top-level files
+                    names.sort()
+                    # intern: folders sharing the same first 7 characters share one KEY string
+                    groups[d] = (sys.intern(folder_key_for(d)), names)
+                for sub in subdirs:
+                    pending.add(pool.submit(scan_dir, sub))
+    # Threads finish in any order; sort so runs (and _1, _2 suffixes) are repeatable.
+    return dict(sorted(groups.items()))
+
+def folder_key_for(parent: str) -> str:
     """
     Derive KEY = the first 7 characters of the file's *immediate* parent folder name.
     If the folder name is shorter than 7, use what exists.
     """
-    return file_path.parent.name[:7]
+    return os.path.basename(parent)[:7]
 
 # ------------------------
 # Main two-pass procedure
 # ------------------------
-def pass1_remove(root: Path, files: List[Path], apply_changes: bool) -> Tuple[int, int]:
+def _do_rename(src: str, dst: str) -> Optional[Exception]:
+    """Rename one file. Returns None on success, or the error that stopped it."""
+    try:
+        os.rename(src, dst)
+        return None
+    except Exception as e:
+        return e
+
+def normalize_files(groups: Dict[str, Tuple[str, List[str]]], apply_changes: bool) -> Tuple[int, int, int]:
     """
-    PASS 1: For each file, remove ALL occurrences of KEY from its stem, then
-    strip leading separators that may remain. If the name changes, rename it.
-
-    Returns (changed_count, total_key_occurrences_removed)
+    Run PASS 1 and PASS 2 together for each file, so every file is renamed
+    at most once and the tree only has to be walked a single time:
+      PASS 1: remove ALL occurrences of KEY from the stem, then strip leading
+              separators that may remain.
+      PASS 2: if the result does not start with KEY, prefix KEY (no extra
+              separators).
+
+    The new names are worked out first; then (with --apply) the renames are
+    handed to a pool of threads, because each rename mostly waits on the
+    disk or network share and several can wait at the same time.
+
+    Returns (changed_count, total_key_occurrences_removed, prefixed_count)
     """
-    changed = 0
-    removed_total = 0
-    total = len(files)
+    # The planned renames, kept as parallel lists of plain values (entry i of
+    # each list belongs to the same file) rather than one tuple per file.
+    srcs: List[str] = []
+    dsts: List[str] = []
+    removed_counts: List[int] = []
+    prefix_flags: List[bool] = []
+    taken: Dict[str, Set[str]] = {}  # per-folder names in use or handed out
+    total = sum(len(fnames) for _, fnames in groups.values())
     done = 0
-    render_progress(done, total, phase="PASS1", extra="removed=0")
-
-    for src in files:
-        stem, ext = src.stem, src.suffix
-        key = folder_key_for(src)
-
-        # Remove all instances of KEY from the filename stem
-        new_stem, removed = remove_all_key_occurrences(stem, key)
-
-        # Clean leftover leading separators after removal
-        new_stem = strip_leading_separators(new_stem)
-
-        if removed > 0 and new_stem != stem:
-            dst = src.with_name(f"{new_stem}{ext}")
-            dst = unique_path(dst)
-            if apply_changes:
-                try:
-                    src.rename(dst)
-                    changed += 1
-                    removed_total += removed
-                except Exception as e:
-                    sys.stdout.write(f"\nERROR (PASS1): {src.name} -> {dst.name}: {e}\n")
+    render_progress(done, total, phase="PLAN")
+
+    for parent, (key, fnames) in groups.items():
+        for fname in fnames:
+            stem, ext = split_name(fname)
+
+            if key and key in stem:
+                # PASS 1: remove all instances of KEY from the filename stem,
+                # then clean leftover leading separators after removal
+                new_stem, removed = remove_all_key_occurrences(stem, key)
+                new_stem = strip_leading_separators(new_stem)
+
+                # PASS 2: enforce KEY at start
+                needs_prefix = not new_stem.startswith(key)
+                if needs_prefix:
+                    new_stem = f"{key}{new_stem}"
+            elif key:
+                # Most names do not contain KEY at all: only PASS 2 applies.
+                new_stem, removed, needs_prefix = f"{key}{stem}", 0, True
             else:
-                changed += 1
-                removed_total += removed
+                new_stem, removed, needs_prefix = stem, 0, False
 
-        done += 1
-        render_progress(done, total, phase="PASS1", extra=f"removed={removed_total}")
+            if new_stem != stem:
+                srcs.append(parent + os.sep + fname)
+                dsts.append(unique_path(parent, new_stem, ext, taken))
+                removed_counts.append(removed)
+                prefix_flags.append(needs_prefix)
 
-    return changed, removed_total
+            done += 1
+            render_progress(done, total, phase="PLAN")
 
-def pass2_prefix(root: Path, files: List[Path], apply_changes: bool) -> int:
-    """
-    PASS 2: Ensure the filename starts with KEY exactly once.
-    After PASS 1, KEY should no longer appear elsewhere in the name.
-    If the name does not start with KEY, we prefix KEY (no extra separators).
+    if not apply_changes:
+        # Dry run: every planned rename counts as a change.
+        return len(srcs), sum(removed_counts), sum(prefix_flags)
 
-    Returns changed_count for PASS 2.
-    """
     changed = 0
-    total = len(files)
+    removed_total = 0
+    prefixed = 0
+    total = len(srcs)
     done = 0
-    render_progress(done, total, phase="PASS2")
-
-    for src in files:
-        stem, ext = src.stem, src.suffix
-        key = folder_key_for(src)
-
-        # If already starts with KEY, nothing to do.
-        if key and not stem.startswith(key):
-            final_stem = f"{key}{stem}"  # enforce KEY at start
-            dst = src.with_name(f"{final_stem}{ext}")
-            dst = unique_path(dst)
-            if apply_changes:
-                try:
-                    src.rename(dst)
-                    changed += 1
-                except Exception as e:
-                    sys.stdout.write(f"\nERROR (PASS2): {src.name} -> {dst.name}: {e}\n")
-            else:
+    render_progress(done, total, phase="RENAME", extra="removed=0")
+
+    with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as pool:
+        # pool.map hands back results in the same order as 'srcs'
+        for i, err in enumerate(pool.map(_do_rename, srcs, dsts)):
+            if err is None:
                 changed += 1
+                removed_total += removed_counts[i]
+                prefixed += prefix_flags[i]
+            else:
+                sys.stdout.write(f"\nERROR: {os.path.basename(srcs[i])} -> {os.path.basename(dsts[i])}: {err}\n")
 
-        done += 1
-        render_progress(done, total, phase="PASS2")
+            done += 1
+            render_progress(done, total, phase="RENAME", extra=f"removed={removed_total}")
 
-    return changed
+    return changed, removed_total, prefixed
 
 # -------------
 # Entry point
@@ -241,32 +322,25 @@ def main():
     args = ap.parse_args()
     apply_changes = args.apply
 
-    root = Path.cwd()
+    root = os.getcwd()
     print(f"Root: {root}")
     print(f"Mode: {'APPLY' if apply_changes else 'DRY RUN'}")
     print("Building workload...")
 
-    files = collect_files_under_subfolders(root)
-    total = len(files)
+    groups = collect_files_under_subfolders(root)
+    total = sum(len(fnames) for _, fnames in groups.values())
     if total == 0:
         print("No files found under subfolders. Nothing to do.")
         return
 
     print(f"Files discovered: {total}\n")
 
-    # PASS 1: remove all occurrences of KEY within stems
-    p1_changed, p1_removed = pass1_remove(root, files, apply_changes)
-    print(f"\nPASS 1 summary: changed={p1_changed}, key-occurrences-removed={p1_removed}")
-
-    # Refresh file list because some paths may have changed after PASS 1
-    files = collect_files_under_subfolders(root)
-
-    # PASS 2: enforce KEY as the filename prefix (exactly once)
-    p2_changed = pass2_prefix(root, files, apply_changes)
-    print(f"\nPASS 2 summary: changed={p2_changed}")
+    # PASS 1 + PASS 2: remove all occurrences of KEY within stems, then
+    # enforce KEY as the filename prefix (exactly once), in one rename per file
+    total_changes, removed, prefixed = normalize_files(groups, apply_changes)
+    print(f"\nSummary: changed={total_changes}, key-occurrences-removed={removed}, prefixed={prefixed}")
 
     # Final recap
-    total_changes = p1_changed + p2_changed
     if apply_changes:
         print(f"\nAll done. Applied changes: {total_changes}")
     else:
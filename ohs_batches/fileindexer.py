@@ -36,7 +36,8 @@ SAFETY / RELIABILITY
 HOW TO USE
 ----------
 1) Set ROOT below to your top folder.
-2) Start with DRY_RUN = True to preview.
+2) Start with DRY_RUN = True to preview. While tuning, you can turn on
+   PDF_CACHE_FILE so repeated previews are faster (delete the file afterwards).
 3) When happy, set DRY_RUN = False and run again.
 4) Close any Explorer windows or files open inside the folders to avoid lock errors.
 """
@@ -45,11 +46,12 @@ from pathlib import Path
 import re
 import time
 import os
-import logging
-from PyPDF2 import PdfReader
-
-# Quiet PyPDF2 logs (some PDFs may still print harmless “unknown widths” lines).
-logging.getLogger("PyPDF2").setLevel(logging.ERROR)
+import sqlite3
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import pypdfium2 as pdfium  # fast PDF text reader (PDFium, the engine inside Chrome)
 
 # ---------------------------- Settings ----------------------------
 
@@ -62,6 +64,12 @@ DRY_RUN = False
 # Read up to this many pages from each PDF when searching inside files.
 MAX_PDF_PAGES = 3
 
+# Off by default. Set to a file path (e.g. Path(__file__).with_name("fileindexer_cache.sqlite"))
+# to save the text read from PDFs there, so repeated DRY_RUN previews don't have to read the
+# same unchanged PDF again. The file holds the full, unencrypted text of the students'
+# documents (SSN cards, birth certificates, medical forms): delete it when you are done.
+PDF_CACHE_FILE = None
+
 # Subfolder must be exactly 8 digits to be considered a student folder.
 ID8 = re.compile(r"^\d{8}$")
 
@@ -69,9 +77,20 @@ ID8 = re.compile(r"^\d{8}$")
 RENAMING_RETRIES = 5
 RETRY_WAIT_SECONDS = 1.5
 
+# Stop checking more files in a folder once a candidate scores at least this.
+# 19 is the most any filename can score (10 + 6 comma + 2 filename + 1 short name);
+# only the DVF rule reaches 22+ in a PDF. Both 2- and 3-word “Last, First” names
+# score 19, and pick_best prefers fewer words on a tie, so the filename scan only
+# stops on a 2-word one (FILENAME_CONFIDENT_WORDS). A later, different 2-word name
+# with fewer letters could still win a full scan; one student's folder shouldn't
+# have two.
+FILENAME_CONFIDENT_SCORE = 19
+FILENAME_CONFIDENT_WORDS = 2
+PDF_CONFIDENT_SCORE = 22
+
 # ------------------ Stopwords / Banned tokens (case-insensitive) ------------------
 # All entries are lower-case; we compare using .lower() so “PSAT”, “Psat”, “psat” all match.
-STOPWORDS_LOWER = {
+STOPWORDS_LOWER = frozenset({
     # admin/common
     "address","application","admissions","admission","admin","administrative","administration",
     "form","forms","report","release","records","record","request","requests","authorization",
@@ -124,37 +143,87 @@ STOPWORDS_LOWER = {
     # other junk we saw in outputs
     "verification","data","medical","flvs","lms","justice","press","squats","president",
     "representative","average","avg","score","test","releaseforrecords","requestreocrds",
-}
+})
 
 # HARD reject pairs like (“verification”, “data”) regardless of anything else.
-BAD_PAIR_LOWER = {
+BAD_PAIR_LOWER = frozenset({
     ("verification", "data"),
     ("school", "lower"),
     ("lower", "school"),
     ("score", "test"),
     ("average", "avg"),
     ("student", "name"),
-}
+})
 
 # allow legit two-letter surnames
-SHORT_ALLOW = {"li","lu","xu","yu","su","wu","ng","ho","hu","ko","do","he"}
+SHORT_ALLOW = frozenset({"li","lu","xu","yu","su","wu","ng","ho","hu","ko","do","he"})
+
+# never part of a name
+EMAIL_TOKENS = frozenset({"email","e-mail"})
 
 # common suffixes
 SUFFIX_ALLOW = {"jr","sr","ii","iii","iv","v"}
+# Lower-cased once here so the name checks don't rebuild it for every word.
+SUFFIX_ALLOW_LOWER = frozenset(s.lower() for s in SUFFIX_ALLOW)
 
 # ------------------------- Patterns (Regex) ------------------------
 
 # One “word” of a name: starts with a capital; may contain letters, apostrophes, periods, hyphens.
 NAME_PART = r"[A-Z][a-zA-Z'.\-]+"
 
-# 1) “Last, First”
-PAT_COMMA = re.compile(rf"\b({NAME_PART}),\s*({NAME_PART}(?:\s+{NAME_PART})*)\b")
+# The two punctuated name shapes in ONE pattern, so each text is scanned once for both.
+# m.lastgroup tells us which shape matched ("comma" or "semi"):
+#   1) “Last, First”
+#   2) “Last; First”
+PAT_NAME = re.compile(
+    rf"""
+    \b(?:
+        (?P<c_last>{NAME_PART}),\s*(?P<c_first>{NAME_PART}(?:\s+{NAME_PART})*)\b(?P<comma>)
+      | (?P<s_last>{NAME_PART});\s*(?P<s_first>{NAME_PART}(?:\s+{NAME_PART})*)\b(?P<semi>)
+    )
+    """,
+    re.X
+)
 
-# 2) “First Last” (we’ll flip to “Last, First”)
-PAT_SPACE = re.compile(rf"\b({NAME_PART})\s+({NAME_PART}(?:\s+{NAME_PART})*)\b")
+# 3) “First Last” (we’ll flip to “Last, First”), scanned in its own pass: a comma/semicolon
+#    match that turns out not to be a name (“Transcript, Hannah Wynn”) must not hide the
+#    “First Last” reading of the same words. It takes at most 4 words in total, and only
+#    when no further name word follows.
+# 4) A run of 5+ Capitalized Words is matched as a whole ("run"), so it is not retried
+#    from every word inside it. Trailing document words are trimmed off (“Hannah Wynn
+#    Immunization Record Request”); if at most 4 words remain they are read as
+#    “First Last”, otherwise (titles, school names, very long names) the run is ignored
+#    rather than cut down to a wrong 4-word name.
+PAT_SPACE = re.compile(
+    rf"""
+    \b(?:
+        (?P<p_first>{NAME_PART})\s+(?P<p_last>{NAME_PART}(?:\s+{NAME_PART}){{0,2}})\b
+        (?!\s+{NAME_PART})(?P<space>)
+      | {NAME_PART}(?:\s+{NAME_PART}){{4,}}\b(?P<run>)
+    )
+    """,
+    re.X
+)
 
-# 3) “Last; First”
-PAT_SEMI  = re.compile(rf"\b({NAME_PART});\s*({NAME_PART}(?:\s+{NAME_PART})*)\b")
+def split_name_match(m):
+    """
+    Turn a PAT_NAME or PAT_SPACE match into (last, first, had_comma), or None
+    for a long run of Capitalized Words. “First Last” matches are flipped to “Last, First”.
+    """
+    kind = m.lastgroup
+    if kind == "run":
+        # drop trailing labels and stopwords, then use the rest only if it is name-sized
+        words = LABEL_TAIL.sub("", m.group(0)).split()
+        while words and is_stopword_token(words[-1]):
+            words.pop()
+        if not 2 <= len(words) <= 4:
+            return None
+        return " ".join(words[1:]), words[0], False
+    if kind == "comma":
+        return m.group("c_last"), m.group("c_first"), True
+    if kind == "semi":
+        return m.group("s_last"), m.group("s_first"), True
+    return m.group("p_last"), m.group("p_first"), False
 
 # Special DVF rule: “Student Name: Last, First” with typical words following it.
 PAT_DVF = re.compile(
@@ -195,22 +264,32 @@ FILENAME_NOISE = re.compile(
 )
 
 # ------------------------- Small helpers --------------------------
-
+# The same short name pieces come up again and again (every match is cleaned
+# more than once, and sibling files share names), so the word checks below
+# remember their answers with lru_cache instead of redoing the work.
+NAME_CACHE_SIZE = 4096
+
+# One translate() table for collapse_ws: non-breaking space -> space, fancy dashes -> "-".
+_WS_TRANS = str.maketrans({
+    "\u00A0": " ",  # non-breaking space
+    "\u2010": "-", "\u2011": "-", "\u2013": "-", "\u2014": "-",
+})
 def collapse_ws(s: str) -> str:
     """Normalize spaces/dashes so patterns match more easily."""
-    s = s.replace("\u00A0"," ")  # non-breaking space
-    s = (s.replace("\u2010","-").replace("\u2011","-")
-           .replace("\u2013","-").replace("\u2014","-"))
-    return re.sub(r"\s+", " ", s).strip()
+    # split() with no arguments breaks on ANY run of whitespace and drops it at
+    # both ends, so joining with " " collapses everything without a regex.
+    return " ".join(s.translate(_WS_TRANS).split())
 
 def norm_cap(s: str) -> str:
     """Capitalize nicely: 'hANNAH wYNN' -> 'Hannah Wynn'."""
     return " ".join(p[:1].upper() + p[1:].lower() if p else p for p in s.split())
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def is_stopword_token(tok: str) -> bool:
     """Case-insensitive stopword check."""
     return tok.lower() in STOPWORDS_LOWER
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def strip_labels(side: str) -> str:
     """
     Remove trailing labels like 'Form', 'Eval', 'Iowa', 'Medical', etc.
@@ -226,29 +305,32 @@ def strip_labels(side: str) -> str:
         return ""
     return side
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def token_ok(tok: str) -> bool:
     """
     Is this word allowed to be part of a real name?
+    - Suffixes like Jr, III are always allowed
     - No digits
     - Not a stopword
     - Very short (<=2) only allowed if in SHORT_ALLOW
     - Not random ALLCAPS (except short pieces)
+    The word is lower-cased once here, so callers don't need to do it too.
     """
     if not tok:
         return False
-    if any(ch.isdigit() for ch in tok):
-        return False
     tlo = tok.lower()
-    if tlo in STOPWORDS_LOWER:
+    if tlo in SUFFIX_ALLOW_LOWER:
+        return True
+    if tlo in STOPWORDS_LOWER or tlo in EMAIL_TOKENS:
         return False
-    if len(tlo) <= 2 and tlo not in SHORT_ALLOW and tlo not in {s.lower() for s in SUFFIX_ALLOW}:
+    if len(tlo) <= 2:
+        return tlo in SHORT_ALLOW
+    if len(tok) > 3 and tok.isupper():
         return False
-    if tok.isupper() and len(tok) > 3:
-        return False
-    if tlo in {"email","e-mail"}:
-        return False
-    return True
+    # digit check last: isalpha() answers it in C for the usual all-letter word
+    return tok.isalpha() or not any(ch.isdigit() for ch in tok)
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def clean_name_side(side_text: str) -> str:
     """
     Clean one side of a name (“Last” OR “First Middle”):
@@ -263,10 +345,11 @@ def clean_name_side(side_text: str) -> str:
     for t in tokens:
         # normalize caps (keep apostrophes/hyphens)
         t_norm = t[:1].upper() + t[1:] if t else t
-        tlo = t_norm.lower()
-        if tlo in {s.lower() for s in SUFFIX_ALLOW} or token_ok(t_norm):
+        if token_ok(t_norm):  # suffixes are allowed inside token_ok
             keep.append(t_norm)
-    return " ".join(keep)
+    # intern: every candidate with this name shares one string object, which
+    # makes the (last, first) lookups in pick_best cheaper
+    return sys.intern(" ".join(keep))
 
 def looks_like_name(last: str, first: str) -> bool:
     """
@@ -274,7 +357,7 @@ def looks_like_name(last: str, first: str) -> bool:
     - Both sides must still have content
     - Neither side can be a lone stopword
     - Pair cannot be in BAD_PAIR_LOWER (e.g., "verification, data")
-    - Every token must pass token_ok or be a suffix
+    - Every token must pass token_ok (which allows suffixes)
     """
     last = clean_name_side(last)
     first = clean_name_side(first)
@@ -287,7 +370,7 @@ def looks_like_name(last: str, first: str) -> bool:
         return False
 
     toks = (last + " " + first).replace(",", " ").split()
-    if not all(token_ok(t) or t.lower() in {s.lower() for s in SUFFIX_ALLOW} for t in toks):
+    if not all(token_ok(t) for t in toks):
         return False
     return True
 
@@ -314,6 +397,11 @@ def score_candidate(last: str, first: str, *, source: str, dvf_hit: bool, had_co
 
 # ------------------- Filename-based extraction --------------------
 
+# Many folders hold files with the very same names (“Data Verification.pdf”,
+# “Immunizations.pdf”, ...), so filename results are remembered by name.
+FILENAME_CACHE_SIZE = 16384
+
+@lru_cache(maxsize=FILENAME_CACHE_SIZE)
 def preclean_filename_text(raw: str) -> str:
     """
     Remove obvious garbage phrases from a filename BEFORE scanning for names.
@@ -333,92 +421,193 @@ def preclean_filename_text(raw: str) -> str:
 def candidates_from_filename(fname: str):
     """
     Find names in the FILE NAME (not the contents).
-    We try:
+    We try (one scan with PAT_NAME, then one with PAT_SPACE):
       1) Last, First
-      2) First Last  (we flip to Last, First)
-      3) Last; First
+      2) Last; First
+      3) First Last  (we flip to Last, First), unless it overlaps a good 1) / 2) match
     Return every good-looking match with a score.
     """
+    yield from _candidates_from_filename_cached(fname)
+
+@lru_cache(maxsize=FILENAME_CACHE_SIZE)
+def _candidates_from_filename_cached(fname: str):
+    """The work behind candidates_from_filename, as a tuple so it can be cached."""
     base = preclean_filename_text(fname)
 
-    # Last, First
-    for m in PAT_COMMA.finditer(base):
-        last, first = norm_cap(m.group(1)), norm_cap(m.group(2))
-        if looks_like_name(last, first):
-            yield (clean_name_side(last), clean_name_side(first),
-                   score_candidate(last, first, source="filename", dvf_hit=False, had_comma=True, near_anchor=False))
-
-    # First Last (flip)
-    for m in PAT_SPACE.finditer(base):
-        f, l = norm_cap(m.group(1)), norm_cap(m.group(2))
-        last, first = l, f
-        if looks_like_name(last, first):
-            yield (clean_name_side(last), clean_name_side(first),
-                   score_candidate(last, first, source="filename", dvf_hit=False, had_comma=False, near_anchor=False))
-
-    # Last; First
-    for m in PAT_SEMI.finditer(base):
-        last, first = norm_cap(m.group(1)), norm_cap(m.group(2))
-        if looks_like_name(last, first):
-            yield (clean_name_side(last), clean_name_side(first),
-                   score_candidate(last, first, source="filename", dvf_hit=False, had_comma=True, near_anchor=False))
+    out = []
+    taken = []  # spans of comma/semicolon matches that passed the checks
+    for pat in (PAT_NAME, PAT_SPACE):
+        for m in pat.finditer(base):
+            parts = split_name_match(m)
+            if parts is None:
+                continue
+            last, first, had_comma = parts
+            if not had_comma and any(s < m.end() and m.start() < e for s, e in taken):
+                continue  # same words as a stronger “Last, First” match
+            last, first = norm_cap(last), norm_cap(first)
+            if looks_like_name(last, first):
+                out.append((clean_name_side(last), clean_name_side(first),
+                            score_candidate(last, first, source="filename", dvf_hit=False, had_comma=had_comma, near_anchor=False)))
+                if had_comma:
+                    taken.append(m.span())
+    return tuple(out)
 
 # -------------------- PDF-based extraction ------------------------
 
-def pdf_text(pdf: Path, max_pages=MAX_PDF_PAGES) -> str:
-    """Read text from up to 'max_pages' of a PDF. If reading fails, return ""."""
+_pdf_cache_db = None  # opened on first use, once per process
+
+def pdf_cache():
+    """
+    Open (once) the PDF text cache from PDF_CACHE_FILE, or return None if
+    caching is turned off or the file can't be opened. SQLite lets all the
+    worker processes share the one file safely.
+    """
+    global _pdf_cache_db
+    if _pdf_cache_db is None and PDF_CACHE_FILE:
+        try:
+            db = sqlite3.connect(str(PDF_CACHE_FILE), timeout=30)
+            db.execute("CREATE TABLE IF NOT EXISTS pdf_text (key TEXT PRIMARY KEY, text TEXT)")
+            db.commit()
+            _pdf_cache_db = db
+        except sqlite3.Error:
+            return None
+    return _pdf_cache_db
+
+def pdf_text(pdf: Path, start=0, stop=MAX_PDF_PAGES) -> str:
+    """
+    Read text from pages start..stop-1 of a PDF (counting from 0). If reading
+    fails, return "". Successful reads are remembered in the PDF cache, keyed by the file's path,
+    size and modified time, so a changed file is always read again. Failed reads are not
+    remembered, so a locked or half-copied PDF is tried again on the next run.
+    """
     try:
-        r = PdfReader(str(pdf))
-    except Exception:
+        st = os.stat(pdf)
+    except OSError:
         return ""
-    chunks = []
-    for p in r.pages[:max_pages]:
+    key = f"{pdf}|{st.st_mtime_ns}|{st.st_size}|{start}-{stop}"
+
+    db = pdf_cache()
+    if db is not None:
         try:
-            chunks.append(p.extract_text() or "")
-        except Exception:
+            row = db.execute("SELECT text FROM pdf_text WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                return row[0]
+        except sqlite3.Error:
             pass
-    return collapse_ws(" ".join(chunks))
+
+    text, complete = read_pdf_text(pdf, start, stop)
+
+    if db is not None and complete:
+        try:
+            with db:  # commits, or rolls back on error
+                db.execute("INSERT OR REPLACE INTO pdf_text (key, text) VALUES (?, ?)", (key, text))
+        except sqlite3.Error:
+            pass  # the cache is only a speed-up; never fail because of it
+    return text
+
+def read_pdf_text(pdf: Path, start=0, stop=MAX_PDF_PAGES) -> tuple[str, bool]:
+    """
+    Read text from pages start..stop-1 of a PDF (no cache). Returns (text, complete):
+    pages that can't be read are skipped and complete is False, so a failed read
+    can be told apart from a PDF that simply has no text.
+    PDFium only loads the pages we ask for, so big PDFs cost no more than small ones.
+    """
+    try:
+        doc = pdfium.PdfDocument(str(pdf))
+    except Exception:
+        return "", False
+    chunks = []
+    complete = True
+    try:
+        for i in range(start, min(len(doc), stop)):
+            try:
+                page = doc[i]
+                textpage = page.get_textpage()
+                chunks.append(textpage.get_text_range() or "")
+                textpage.close()
+                page.close()
+            except Exception:
+                complete = False
+    finally:
+        doc.close()
+    return collapse_ws(" ".join(chunks)), complete
+
+# Highest score a “First Last” (no comma) PDF match can get from score_candidate:
+# 10 + 1 (pdf) + 1 (short name) = 12.
+SPACE_MAX_SCORE = 12
+
+# If page 1 alone gives a candidate scoring at least this (any comma-style
+# match), the remaining pages are not read.
+FIRST_PAGE_ENOUGH_SCORE = 15
 
 def candidates_from_pdf(pdf: Path):
     """
-    Find names INSIDE a PDF:
+    Find names INSIDE a PDF (see candidates_from_text).
+    Page 1 is read first; pages 2..MAX_PDF_PAGES are only read when page 1
+    gave no good candidate. DVFs have the student name on page 1.
+    """
+    blob = pdf_text(pdf, 0, 1)
+    out = candidates_from_text(blob)
+    if MAX_PDF_PAGES > 1 and not any(sc >= FIRST_PAGE_ENOUGH_SCORE for _, _, sc in out):
+        rest = pdf_text(pdf, 1, MAX_PDF_PAGES)
+        if rest:
+            # scan all pages together, so matches near the page break still count
+            out = candidates_from_text(f"{blob} {rest}" if blob else rest)
+    return out
+
+def candidates_from_text(blob: str):
+    """
+    Find names in text read from a PDF:
       - Special DVF rule (“Student Name: Last, First”).
       - General patterns (“Last, First”, “Last; First”, “First Last”).
       - Reject if near bad context words (guardian, address, etc.).
       - Clean out trailing labels like “Form”, “Iowa”, “PSAT”, “Medical”.
     """
-    blob = pdf_text(pdf)
     if not blob:
         return []
     out = []
-
-    # Strong DVF rule first
-    for m in PAT_DVF.finditer(blob):
-        last = strip_labels(norm_cap(m.group("last")))
-        first = strip_labels(norm_cap(m.group("first")))
-        if looks_like_name(last, first):
-            out.append((clean_name_side(last), clean_name_side(first),
-                        score_candidate(last, first, source="pdf", dvf_hit=True, had_comma=True, near_anchor=True)))
-
-    # General patterns
-    for pat, had_comma in ((PAT_COMMA, True), (PAT_SEMI, True), (PAT_SPACE, False)):
+    best_score = 0
+
+    # Strong DVF rule first (only worth running if the word “Student” is there)
+    if "student" in blob.lower():
+        for m in PAT_DVF.finditer(blob):
+            last = strip_labels(norm_cap(m.group("last")))
+            first = strip_labels(norm_cap(m.group("first")))
+            if looks_like_name(last, first):
+                sc = score_candidate(last, first, source="pdf", dvf_hit=True, had_comma=True, near_anchor=True)
+                out.append((clean_name_side(last), clean_name_side(first), sc))
+                best_score = max(best_score, sc)
+
+    # Find every bad context word ONCE for the whole text, instead of
+    # re-searching an 80-character neighborhood around each match.
+    bad_starts, bad_ends = [], []
+    for bad in CONTEXT_REJECT.finditer(blob):
+        bad_starts.append(bad.start())
+        bad_ends.append(bad.end())
+
+    # General patterns: one scan for “Last, First” / “Last; First”, then one for “First Last”
+    for pat in (PAT_NAME, PAT_SPACE):
+        if pat is PAT_SPACE and best_score > SPACE_MAX_SCORE:
+            break  # “First Last” hits can never win any more
         for m in pat.finditer(blob):
-            if had_comma:
-                last, first = norm_cap(m.group(1)), norm_cap(m.group(2))
-            else:
-                f, l = norm_cap(m.group(1)), norm_cap(m.group(2))
-                last, first = l, f
+            parts = split_name_match(m)
+            if parts is None:
+                continue
+            last, first, had_comma = parts
+            last, first = norm_cap(last), norm_cap(first)
 
-            # neighborhood text for context check
-            ctx = blob[max(0, m.start()-80): m.end()+80]
-            if CONTEXT_REJECT.search(ctx):
+            # neighborhood check: is any bad context word within 80 characters?
+            # (bisect finds the first bad word ending after the neighborhood starts)
+            i = bisect_right(bad_ends, m.start() - 80)
+            if i < len(bad_starts) and bad_starts[i] < m.end() + 80:
                 continue
 
             last_clean = clean_name_side(last)
             first_clean = clean_name_side(first)
             if last_clean and first_clean and looks_like_name(last_clean, first_clean):
-                out.append((last_clean, first_clean,
-                            score_candidate(last_clean, first_clean, source="pdf", dvf_hit=False, had_comma=had_comma, near_anchor=False)))
+                sc = score_candidate(last_clean, first_clean, source="pdf", dvf_hit=False, had_comma=had_comma, near_anchor=False)
+                out.append((last_clean, first_clean, sc))
+                best_score = max(best_score, sc)
     return out
 
 # -------------------- Picking the best match ----------------------
@@ -426,7 +615,7 @@ def candidates_from_pdf(pdf: Path):
 def pick_best(cands):
     """
     From many candidates, keep the highest score for each unique (last, first),
-    then sort and pick the winner.
+    then pick the winner (best score, then fewest words, then shortest).
     """
     if not cands:
         return None
@@ -434,7 +623,8 @@ def pick_best(cands):
     best = {}
     for last, first, sc in cands:
         key = (last, first)
-        if key not in best or sc > best[key]:
+        cur = best.get(key)
+        if cur is None or sc > cur:
             best[key] = sc
 
     def sort_key(kv):
@@ -443,7 +633,8 @@ def pick_best(cands):
         total_len = len(last.replace(" ","")) + len(first.replace(" ",""))
         return (-sc, tokens, total_len)
 
-    return sorted(best.items(), key=sort_key)[0][0]
+    # min() gives the same winner as sorted(...)[0] without sorting everything
+    return min(best.items(), key=sort_key)[0]
 
 # --------------------------- Renaming -----------------------------
 
@@ -500,17 +691,26 @@ def derive_name_for_folder(folder: Path):
     """
     Figure out the student’s name for ONE folder.
 
-    IMPORTANT: We check ALL files in the folder.
+    IMPORTANT: We check ALL files in the folder, unless we already found a
+    very confident match (see FILENAME_CONFIDENT_SCORE / PDF_CONFIDENT_SCORE).
       1) Try ALL filenames first (fast).
       2) If needed, look INSIDE ALL PDFs (slower but powerful).
 
     Return (last, first) or None.
     """
+    # List the folder ONCE. os.scandir already knows which entries are files,
+    # so this needs no extra disk lookups and no Path object per file.
+    with os.scandir(folder) as it:
+        files = [(e.name, e.path) for e in it if e.is_file()]
+
     # Step 1: filenames (ALL files)
     file_name_cands = []
-    for f in folder.iterdir():
-        if f.is_file():
-            file_name_cands.extend(candidates_from_filename(f.name))
+    for name, _ in files:
+        found = list(candidates_from_filename(name))
+        file_name_cands.extend(found)
+        if any(sc >= FILENAME_CONFIDENT_SCORE and len(f"{last} {first}".split()) <= FILENAME_CONFIDENT_WORDS
+               for last, first, sc in found):
+            break
 
     best_from_names = pick_best(file_name_cands)
     if best_from_names:
@@ -518,28 +718,44 @@ def derive_name_for_folder(folder: Path):
 
     # Step 2: PDF contents (ALL PDFs)
     pdf_cands = []
-    for f in folder.iterdir():
-        if f.is_file() and f.suffix.lower() == ".pdf":
-            pdf_cands.extend(candidates_from_pdf(f))
+    for name, path in files:
+        if name.lower().endswith(".pdf"):
+            found = candidates_from_pdf(Path(path))
+            pdf_cands.extend(found)
+            if any(sc >= PDF_CONFIDENT_SCORE for _, _, sc in found):
+                break  # DVF hit: no need to open the rest
 
     return pick_best(pdf_cands)
 
+def plan_folder(folder: Path):
+    """
+    Worker job for ONE folder: find the name but do NOT rename anything.
+    Returns (folder, (last, first) or None).
+    """
+    return folder, derive_name_for_folder(folder)
+
 def main():
     """
     Walk through ROOT and process every subfolder named like 8 digits (e.g., "12345678").
     For each one, try to find “Last, First” and rename the folder safely.
+
+    Reading PDFs is slow CPU work, so several folders are searched at the same
+    time in separate processes (one per CPU core). The renames themselves
+    still happen one at a time, here in the main process.
     """
-    for child in ROOT.iterdir():
-        if not child.is_dir():
-            continue
-        if not ID8.fullmatch(child.name):
-            continue
-
-        best = derive_name_for_folder(child)
-        if best:
-            safe_rename(child, target_name(child.name, best))
-        else:
-            print(f"[SKIP] {child.name}  no reliable name")
+    # os.scandir already knows which entries are folders; checking the
+    # 8-digit name first means other entries cost nothing extra.
+    with os.scandir(ROOT) as it:
+        folders = [Path(e.path) for e in it
+                   if ID8.fullmatch(e.name) and e.is_dir()]
+
+    with ProcessPoolExecutor() as ex:
+        # map() hands results back in the same order as 'folders'
+        for child, best in ex.map(plan_folder, folders, chunksize=8):
+            if best:
+                safe_rename(child, target_name(child.name, best))
+            else:
+                print(f"[SKIP] {child.name}  no reliable name")
 
 if __name__ == "__main__":
     main()
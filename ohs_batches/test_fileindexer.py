@@ -0,0 +1,47 @@
+"""
+Regression tests for the name finding in fileindexer.py.
+
+Run from this folder with:  python -m unittest test_fileindexer
+"""
+
+import unittest
+
+import fileindexer
+
+
+def best_from_filename(fname):
+    return fileindexer.pick_best(list(fileindexer.candidates_from_filename(fname)))
+
+
+def best_from_text(text):
+    return fileindexer.pick_best(fileindexer.candidates_from_text(fileindexer.collapse_ws(text)))
+
+
+class FilenameNameTests(unittest.TestCase):
+    def test_last_first(self):
+        self.assertEqual(best_from_filename("Wynn, Hannah - Immunizations.pdf"), ("Wynn", "Hannah"))
+
+    def test_first_last_before_comma_label(self):
+        self.assertEqual(best_from_filename("Hannah Wynn, Transcript.pdf"), ("Wynn", "Hannah"))
+
+    def test_first_last_after_comma_label(self):
+        self.assertEqual(best_from_filename("Transcript, Hannah Wynn.pdf"), ("Wynn", "Hannah"))
+        self.assertEqual(best_from_filename("Immunizations, Hannah Wynn.pdf"), ("Wynn", "Hannah"))
+
+    def test_first_last_before_document_words(self):
+        self.assertEqual(best_from_filename("Hannah Wynn Immunization Record Request.pdf"), ("Wynn", "Hannah"))
+
+    def test_long_name_is_not_cut_short(self):
+        self.assertIsNone(best_from_filename("Mary Ann Van Der Berg.pdf"))
+
+
+class TextNameTests(unittest.TestCase):
+    def test_first_last_after_comma_label(self):
+        self.assertEqual(best_from_text("Transcript, John Smith attended classes in 2019."), ("Smith", "John"))
+
+    def test_dvf(self):
+        self.assertEqual(best_from_text("Data Verification Form Student Name: Wynn, Hannah Grade: 5"), ("Wynn", "Hannah"))
+
+
+if __name__ == "__main__":
+    unittest.main()